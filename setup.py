@@ -33,9 +33,13 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.0.0",
+            "pytest-asyncio>=0.21.0,<0.26.0; python_version < '3.9'",
+            "pytest-asyncio>=0.26.0; python_version >= '3.9'",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "isort>=5.12.0",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
         ],
     },
     entry_points={
@@ -26,6 +26,18 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+ARCHITECTURE_SUMMARY = "\n".join([
+    "\n🎯 Architecture Components Demonstrated:",
+    "   • Models: User entity with business logic",
+    "   • Repositories: Data access layer with in-memory storage",
+    "   • Services: Business logic layer with validation",
+    "   • Controllers: Presentation layer with HTTP handling",
+    "   • DTOs: Data transfer objects for clean API contracts",
+    "   • Exceptions: Custom error handling",
+    "   • Middleware: Cross-cutting concerns (logging, validation, etc.)",
+    "   • Constants: Configuration and application constants",
+])
+
 
 class ApplicationContainer:
     """Dependency injection container."""
@@ -118,15 +130,19 @@ class Application:
         """Main application logic with clean architecture demonstration."""
         logger.info("Running main application logic...")
         
-        print(f"Welcome to {self.config.app_name}!")
-        print("This application demonstrates clean architecture patterns.")
-        print("=" * 60)
+        print("\n".join([
+            f"Welcome to {self.config.app_name}!",
+            "This application demonstrates clean architecture patterns.",
+            "=" * 60,
+        ]))
         
         # Demonstrate the clean architecture
         await self._demonstrate_architecture()
         
-        print("\nApplication ready for extension!")
-        print("Add your business logic to services, controllers, and repositories.")
+        print("\n".join([
+            "\nApplication ready for extension!",
+            "Add your business logic to services, controllers, and repositories.",
+        ]))
     
     async def _demonstrate_architecture(self):
         """Demonstrate the clean architecture with example operations."""
@@ -202,15 +218,7 @@ class Application:
             else:
                 print(f"   ❌ Failed to create user: {processed_response.get('error', {}).get('message', 'Unknown error')}")
             
-            print("\n🎯 Architecture Components Demonstrated:")
-            print("   • Models: User entity with business logic")
-            print("   • Repositories: Data access layer with in-memory storage")
-            print("   • Services: Business logic layer with validation")
-            print("   • Controllers: Presentation layer with HTTP handling")
-            print("   • DTOs: Data transfer objects for clean API contracts")
-            print("   • Exceptions: Custom error handling")
-            print("   • Middleware: Cross-cutting concerns (logging, validation, etc.)")
-            print("   • Constants: Configuration and application constants")
+            print(ARCHITECTURE_SUMMARY)
             
         except Exception as e:
             logger.error(f"Error in architecture demonstration: {e}")
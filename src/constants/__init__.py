@@ -109,6 +109,10 @@ class DefaultValues:
     DEFAULT_REQUEST_TIMEOUT = 30
     DEFAULT_DATABASE_TIMEOUT = 10
     DEFAULT_CACHE_TTL = 300  # 5 minutes
+    
+    # Email lookup cache defaults
+    EMAIL_LOOKUP_CACHE_TTL = 5  # seconds
+    EMAIL_LOOKUP_CACHE_SIZE = 4096
 
 
 class RegexPatterns:
@@ -24,7 +24,7 @@ class BaseController(IController, ABC):
     async def get_by_id(self, entity_id: str) -> Dict[str, Any]:
         """Handle GET request for single entity."""
         try:
-            logger.info(f"Controller: Getting entity by ID: {entity_id}")
+            logger.debug("Controller: Getting entity by ID: %s", entity_id)
             
             entity = await self._service.get_by_id(entity_id)
             
@@ -34,13 +34,13 @@ class BaseController(IController, ABC):
             return self._success_response(self._serialize_entity(entity))
             
         except Exception as e:
-            logger.error(f"Error getting entity by ID: {e}")
+            logger.error("Error getting entity by ID: %s", e)
             return self._error_response(str(e))
     
     async def get_all(self, skip: int = 0, limit: int = 100) -> Dict[str, Any]:
         """Handle GET request for all entities."""
         try:
-            logger.info(f"Controller: Getting all entities - skip: {skip}, limit: {limit}")
+            logger.debug("Controller: Getting all entities - skip: %s, limit: %s", skip, limit)
             
             entities = await self._service.get_all(skip, limit)
             
@@ -54,29 +54,29 @@ class BaseController(IController, ABC):
             })
             
         except Exception as e:
-            logger.error(f"Error getting all entities: {e}")
+            logger.error("Error getting all entities: %s", e)
             return self._error_response(str(e))
     
     async def create(self, entity_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle POST request to create entity."""
         try:
-            logger.info("Controller: Creating new entity")
+            logger.debug("Controller: Creating new entity")
             
             entity = await self._service.create(entity_data)
             
             return self._created_response(self._serialize_entity(entity))
             
         except ValueError as e:
-            logger.warning(f"Validation error creating entity: {e}")
+            logger.warning("Validation error creating entity: %s", e)
             return self._bad_request_response(str(e))
         except Exception as e:
-            logger.error(f"Error creating entity: {e}")
+            logger.error("Error creating entity: %s", e)
             return self._error_response(str(e))
     
     async def update(self, entity_id: str, entity_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle PUT request to update entity."""
         try:
-            logger.info(f"Controller: Updating entity with ID: {entity_id}")
+            logger.debug("Controller: Updating entity with ID: %s", entity_id)
             
             entity = await self._service.update(entity_id, entity_data)
             
@@ -86,16 +86,16 @@ class BaseController(IController, ABC):
             return self._success_response(self._serialize_entity(entity))
             
         except ValueError as e:
-            logger.warning(f"Validation error updating entity: {e}")
+            logger.warning("Validation error updating entity: %s", e)
             return self._bad_request_response(str(e))
         except Exception as e:
-            logger.error(f"Error updating entity: {e}")
+            logger.error("Error updating entity: %s", e)
             return self._error_response(str(e))
     
     async def delete(self, entity_id: str) -> Dict[str, Any]:
         """Handle DELETE request for entity."""
         try:
-            logger.info(f"Controller: Deleting entity with ID: {entity_id}")
+            logger.debug("Controller: Deleting entity with ID: %s", entity_id)
             
             success = await self._service.delete(entity_id)
             
@@ -105,7 +105,7 @@ class BaseController(IController, ABC):
             return self._no_content_response()
             
         except Exception as e:
-            logger.error(f"Error deleting entity: {e}")
+            logger.error("Error deleting entity: %s", e)
             return self._error_response(str(e))
     
     def _serialize_entity(self, entity) -> Dict[str, Any]:
@@ -4,21 +4,29 @@ Data Transfer Objects (DTOs) for API request/response handling.
 
 from abc import ABC
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 from dataclasses import dataclass
 
 
+@lru_cache(maxsize=None)
+def _dataclass_field_names(cls: type) -> Tuple[str, ...]:
+    """Get the field names of a dataclass type."""
+    return tuple(cls.__dataclass_fields__)
+
+
 class BaseDTO(ABC):
     """Base DTO class with common serialization methods."""
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert DTO to dictionary."""
         if hasattr(self, '__dataclass_fields__'):
-            return {
-                field.name: getattr(self, field.name) 
-                for field in self.__dataclass_fields__.values()
-                if getattr(self, field.name, None) is not None
-            }
+            data = {}
+            for name in _dataclass_field_names(type(self)):
+                value = getattr(self, name, None)
+                if value is not None:
+                    data[name] = value
+            return data
         return self.__dict__.copy()
     
     @classmethod
@@ -42,12 +42,12 @@ class LoggingMiddleware(BaseMiddleware):
     
     async def process_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """Log incoming request."""
-        logger.info(f"Incoming request: {request_data.get('method', 'UNKNOWN')} {request_data.get('path', '/')}")
-        logger.debug(f"Request data: {request_data}")
+        logger.info("Incoming request: %s %s", request_data.get('method', 'UNKNOWN'), request_data.get('path', '/'))
+        logger.debug("Request data: %s", request_data)
         
         # Add timestamp to request
-        request_data['_start_time'] = time.time()
-        request_data['_request_id'] = f"req_{int(time.time() * 1000)}"
+        request_data['_start_time'] = time.monotonic_ns()
+        request_data['_request_id'] = f"req_{time.time_ns() // 1_000_000}"
         
         return request_data
     
@@ -57,14 +57,14 @@ class LoggingMiddleware(BaseMiddleware):
         
         # Calculate response time if start time is available
         start_time = response_data.get('_start_time')
-        response_time = f" ({(time.time() - start_time) * 1000:.2f}ms)" if start_time else ""
+        response_time = f" ({(time.monotonic_ns() - start_time) / 1_000_000:.2f}ms)" if start_time else ""
         
-        logger.info(f"Response: {status_code}{response_time}")
+        logger.info("Response: %s%s", status_code, response_time)
         
         if status_code >= 400:
-            logger.warning(f"Error response: {response_data}")
+            logger.warning("Error response: %s", response_data)
         else:
-            logger.debug(f"Response data: {response_data}")
+            logger.debug("Response data: %s", response_data)
         
         return response_data
 
@@ -78,7 +78,7 @@ class ExceptionHandlingMiddleware(BaseMiddleware):
     
     async def process_exception(self, exception: Exception) -> Dict[str, Any]:
         """Handle and format exceptions."""
-        logger.exception(f"Unhandled exception: {exception}")
+        logger.exception("Unhandled exception: %s", exception)
         
         # Handle custom application exceptions
         if isinstance(exception, BaseApplicationException):
@@ -171,22 +171,23 @@ class PerformanceMiddleware(BaseMiddleware):
     
     async def process_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """Start performance tracking."""
-        request_data['_perf_start'] = time.perf_counter()
+        request_data['_perf_start'] = time.perf_counter_ns()
         return request_data
     
     async def process_response(self, response_data: Dict[str, Any]) -> Dict[str, Any]:
         """Add performance metrics to response."""
-        start_time = response_data.get('_perf_start')
-        if start_time:
-            duration = time.perf_counter() - start_time
+        start_ns = response_data.get('_perf_start')
+        if start_ns:
+            duration_ns = time.perf_counter_ns() - start_ns
+            duration_ms = duration_ns / 1_000_000
             response_data['_performance'] = {
-                'duration_ms': round(duration * 1000, 2),
+                'duration_ms': round(duration_ms, 2),
                 'timestamp': datetime.utcnow().isoformat()
             }
             
             # Log slow requests
-            if duration > 1.0:  # Slower than 1 second
-                logger.warning(f"Slow request detected: {duration * 1000:.2f}ms")
+            if duration_ns > 1_000_000_000:  # Slower than 1 second
+                logger.warning("Slow request detected: %.2fms", duration_ms)
         
         return response_data
 
@@ -197,11 +198,17 @@ class MiddlewareChain:
     def __init__(self):
         """Initialize middleware chain."""
         self.middlewares = []
+        self._exception_handlers = []
     
     def add_middleware(self, middleware: BaseMiddleware):
         """Add middleware to the chain."""
         self.middlewares.append(middleware)
-        logger.info(f"Added middleware: {middleware.name}")
+        
+        # Only middlewares overriding process_exception take part in error handling
+        if type(middleware).process_exception is not BaseMiddleware.process_exception:
+            self._exception_handlers.append(middleware)
+        
+        logger.info("Added middleware: %s", middleware.name)
     
     async def process_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process request through all middlewares."""
@@ -211,7 +218,7 @@ class MiddlewareChain:
             try:
                 current_data = await middleware.process_request(current_data)
             except Exception as e:
-                logger.error(f"Error in middleware {middleware.name}: {e}")
+                logger.error("Error in middleware %s: %s", middleware.name, e)
                 raise
         
         return current_data
@@ -225,19 +232,19 @@ class MiddlewareChain:
             try:
                 current_data = await middleware.process_response(current_data)
             except Exception as e:
-                logger.error(f"Error in middleware {middleware.name}: {e}")
+                logger.error("Error in middleware %s: %s", middleware.name, e)
                 # Continue processing other middlewares for responses
         
         return current_data
     
     async def process_exception(self, exception: Exception) -> Optional[Dict[str, Any]]:
         """Process exception through middlewares."""
-        for middleware in self.middlewares:
+        for middleware in self._exception_handlers:
             try:
                 result = await middleware.process_exception(exception)
                 if result:
                     return result
             except Exception as e:
-                logger.error(f"Error in exception handling middleware {middleware.name}: {e}")
+                logger.error("Error in exception handling middleware %s: %s", middleware.name, e)
         
         return None
\ No newline at end of file
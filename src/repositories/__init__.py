@@ -31,6 +31,12 @@ class BaseRepository(IRepository[T], ABC):
         self._data[entity_id] = entity
         return entity
     
+    async def create_many(self, entities: List[T]) -> List[T]:
+        """Create multiple entities in a single call."""
+        for entity in entities:
+            self._data[self._generate_id(entity)] = entity
+        return list(entities)
+    
     async def update(self, entity_id: str, entity: T) -> Optional[T]:
         """Update an existing entity."""
         if entity_id in self._data:
@@ -21,6 +21,17 @@ class UserRepository(BaseRepository[User]):
                 return user
         return None
     
+    async def create_if_email_unique(self, user: User) -> Optional[User]:
+        """Create user unless the email is already taken.
+        
+        The check and the insert never yield to the event loop in between,
+        so concurrent creates cannot both claim the same email.
+        """
+        for existing in self._data.values():
+            if existing.email == user.email:
+                return None
+        return await self.create(user)
+    
     async def get_active_users(self) -> List[User]:
         """Get all active users."""
         return [user for user in self._data.values() if user.is_active]
@@ -20,7 +20,7 @@ class BaseService(IService[T], ABC):
     
     async def get_by_id(self, entity_id: str) -> Optional[T]:
         """Get entity by ID with business logic."""
-        logger.info(f"Getting entity by ID: {entity_id}")
+        logger.debug("Getting entity by ID: %s", entity_id)
         
         if not entity_id:
             logger.warning("Entity ID cannot be empty")
@@ -28,13 +28,13 @@ class BaseService(IService[T], ABC):
         
         entity = await self._repository.get_by_id(entity_id)
         if not entity:
-            logger.warning(f"Entity not found with ID: {entity_id}")
+            logger.warning("Entity not found with ID: %s", entity_id)
         
         return entity
     
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
         """Get all entities with business logic."""
-        logger.info(f"Getting all entities - skip: {skip}, limit: {limit}")
+        logger.debug("Getting all entities - skip: %s, limit: %s", skip, limit)
         
         # Validate pagination parameters
         if skip < 0:
@@ -46,7 +46,7 @@ class BaseService(IService[T], ABC):
     
     async def create(self, entity_data: Dict[str, Any]) -> T:
         """Create entity with business logic and validation."""
-        logger.info("Creating new entity")
+        logger.debug("Creating new entity")
         
         # Validate entity data
         await self._validate_entity_data(entity_data)
@@ -55,19 +55,19 @@ class BaseService(IService[T], ABC):
         entity = await self._create_entity_from_data(entity_data)
         
         # Save entity
-        created_entity = await self._repository.create(entity)
+        created_entity = await self._save_new_entity(entity)
         
-        logger.info("Entity created successfully")
+        logger.debug("Entity created successfully")
         return created_entity
     
     async def update(self, entity_id: str, entity_data: Dict[str, Any]) -> Optional[T]:
         """Update entity with business logic and validation."""
-        logger.info(f"Updating entity with ID: {entity_id}")
+        logger.debug("Updating entity with ID: %s", entity_id)
         
         # Check if entity exists
         existing_entity = await self._repository.get_by_id(entity_id)
         if not existing_entity:
-            logger.warning(f"Entity not found for update: {entity_id}")
+            logger.warning("Entity not found for update: %s", entity_id)
             return None
         
         # Validate entity data
@@ -79,27 +79,27 @@ class BaseService(IService[T], ABC):
         # Save updated entity
         result = await self._repository.update(entity_id, updated_entity)
         
-        logger.info("Entity updated successfully")
+        logger.debug("Entity updated successfully")
         return result
     
     async def delete(self, entity_id: str) -> bool:
         """Delete entity with business logic."""
-        logger.info(f"Deleting entity with ID: {entity_id}")
+        logger.debug("Deleting entity with ID: %s", entity_id)
         
         # Check if entity exists
         if not await self._repository.exists(entity_id):
-            logger.warning(f"Entity not found for deletion: {entity_id}")
+            logger.warning("Entity not found for deletion: %s", entity_id)
             return False
         
         # Perform business logic checks before deletion
         if not await self._can_delete_entity(entity_id):
-            logger.warning(f"Entity cannot be deleted: {entity_id}")
+            logger.warning("Entity cannot be deleted: %s", entity_id)
             return False
         
         result = await self._repository.delete(entity_id)
         
         if result:
-            logger.info("Entity deleted successfully")
+            logger.debug("Entity deleted successfully")
         
         return result
     
@@ -116,6 +116,10 @@ class BaseService(IService[T], ABC):
         """Update entity from data. Must be implemented in subclasses."""
         raise NotImplementedError("Subclasses must implement _update_entity_from_data")
     
+    async def _save_new_entity(self, entity: T) -> T:
+        """Persist a newly created entity. Override in subclasses."""
+        return await self._repository.create(entity)
+    
     async def _can_delete_entity(self, entity_id: str) -> bool:
         """Check if entity can be deleted. Override in subclasses."""
         return True
\ No newline at end of file
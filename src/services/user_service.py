@@ -2,11 +2,15 @@
 User service implementation with business logic.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import re
+import time
 from src.services import BaseService
 from src.models.user import User
 from src.repositories.user_repository import UserRepository
+from src.constants import RegexPatterns, CacheKeys, DefaultValues
+
+_EMAIL_RE = re.compile(RegexPatterns.EMAIL, re.ASCII)
 
 
 class UserService(BaseService[User]):
@@ -16,13 +20,14 @@ class UserService(BaseService[User]):
         """Initialize user service."""
         super().__init__(repository)
         self._user_repository = repository  # Type-specific repository
+        self._email_cache: Dict[str, Tuple[float, User]] = {}
     
-    async def get_by_email(self, email: str) -> Optional[User]:
-        """Get user by email with business validation."""
-        if not self._is_valid_email(email):
+    async def get_by_email(self, email: str, validate: bool = False) -> Optional[User]:
+        """Get user by email, optionally checking the email format first."""
+        if validate and not self._is_valid_email(email):
             return None
         
-        return await self._user_repository.get_by_email(email)
+        return await self._lookup_by_email_cached(email)
     
     async def get_active_users(self) -> List[User]:
         """Get all active users."""
@@ -33,6 +38,10 @@ class UserService(BaseService[User]):
         users = await self._user_repository.get_users_by_age_range(18, 150)
         return users
     
+    def validate_emails_bulk(self, emails: List[str]) -> List[bool]:
+        """Validate many email addresses with the precompiled pattern."""
+        return [isinstance(email, str) and _EMAIL_RE.fullmatch(email) is not None for email in emails]
+    
     async def activate_user(self, user_id: str) -> Optional[User]:
         """Activate a user account."""
         user = await self._repository.get_by_id(user_id)
@@ -78,10 +87,10 @@ class UserService(BaseService[User]):
             if not isinstance(name, str) or len(name.strip()) < 2:
                 raise ValueError("Name must be at least 2 characters long")
         
-        # Check for duplicate email (only for creation or email change)
-        if 'email' in entity_data:
-            existing_user = await self._user_repository.get_by_email(entity_data['email'])
-            if existing_user and (not is_update or existing_user.id != entity_data.get('id')):
+        # Check for duplicate email on email change; creation is guarded by the repository
+        if is_update and 'email' in entity_data:
+            existing_user = await self._lookup_by_email_cached(entity_data['email'])
+            if existing_user and existing_user.id != entity_data.get('id'):
                 raise ValueError("Email already exists")
     
     async def _create_entity_from_data(self, entity_data: Dict[str, Any]) -> User:
@@ -93,9 +102,17 @@ class UserService(BaseService[User]):
             is_active=entity_data.get('is_active', True)
         )
     
+    async def _save_new_entity(self, entity: User) -> User:
+        """Create user in a single email-uniqueness-guarded repository call."""
+        created_user = await self._user_repository.create_if_email_unique(entity)
+        if not created_user:
+            raise ValueError("Email already exists")
+        return created_user
+    
     async def _update_entity_from_data(self, existing_entity: User, entity_data: Dict[str, Any]) -> User:
         """Update user from data."""
         if 'email' in entity_data:
+            self._invalidate_email_cache(existing_entity.email)
             existing_entity.email = entity_data['email']
         if 'name' in entity_data:
             existing_entity.name = entity_data['name']
@@ -116,10 +133,42 @@ class UserService(BaseService[User]):
         # Business rule: Can only delete inactive users
         return not user.is_active
     
+    async def _lookup_by_email_cached(self, email: str) -> Optional[User]:
+        """Get user by email, serving recent hits from a short-TTL cache."""
+        key = CacheKeys.USER_BY_EMAIL.format(email=email)
+        now = time.monotonic()
+        
+        cached = self._email_cache.get(key)
+        if cached and cached[0] > now and cached[1].email == email:
+            # Confirm the user is still stored, since it may be removed without going through this service
+            if await self._repository.get_by_id(cached[1].id) is cached[1]:
+                return cached[1]
+        
+        # Only hits are cached so a new user is never hidden from the duplicate check
+        user = await self._user_repository.get_by_email(email)
+        if user:
+            if len(self._email_cache) >= DefaultValues.EMAIL_LOOKUP_CACHE_SIZE:
+                self._email_cache.pop(next(iter(self._email_cache)))
+            self._email_cache[key] = (now + DefaultValues.EMAIL_LOOKUP_CACHE_TTL, user)
+        else:
+            self._email_cache.pop(key, None)
+        
+        return user
+    
+    def _invalidate_email_cache(self, email: Optional[str]) -> None:
+        """Drop a cached email lookup."""
+        if email:
+            self._email_cache.pop(CacheKeys.USER_BY_EMAIL.format(email=email), None)
+    
     def _is_valid_email(self, email: str) -> bool:
         """Validate email format."""
         if not email or not isinstance(email, str):
             return False
         
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
\ No newline at end of file
+        # Cheap scans reject most non-emails before running the regex
+        at = email.rfind('@')
+        if at < 1 or '.' not in email[at + 1:]:
+            return False
+        
+        # fullmatch, since '$' alone also matches before a trailing newline
+        return _EMAIL_RE.fullmatch(email) is not None
\ No newline at end of file
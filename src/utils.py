@@ -2,15 +2,24 @@
 Utility functions for the 4IR Backend Project Summit.
 """
 
+import asyncio
 import json
 import os
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load configuration from a JSON file.
     
+    Files are parsed with orjson when it is installed, falling back to the
+    standard json module for input orjson rejects.
+    
     Args:
         config_path: Path to the configuration file
         
@@ -21,11 +30,43 @@ def load_config(config_path: str) -> Dict[str, Any]:
         FileNotFoundError: If the config file doesn't exist
         json.JSONDecodeError: If the config file is not valid JSON
     """
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        with open(config_path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
     
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _parse_json(data)
+
+
+def _parse_json(data: bytes) -> Any:
+    """Parse JSON bytes, accepting everything save_config can write."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # json.dumps writes NaN/Infinity and integers wider than 64 bits,
+            # which orjson rejects; the stdlib parser decides what is invalid
+            pass
+    return json.loads(data)
+
+
+async def load_config_async(config_path: str) -> Dict[str, Any]:
+    """
+    Load configuration from a JSON file without blocking the event loop.
+    
+    Args:
+        config_path: Path to the configuration file
+        
+    Returns:
+        Dictionary containing configuration data
+        
+    Raises:
+        FileNotFoundError: If the config file doesn't exist
+        json.JSONDecodeError: If the config file is not valid JSON
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, load_config, config_path)
 
 
 def save_config(config: Dict[str, Any], config_path: str) -> None:
@@ -39,7 +80,7 @@ def save_config(config: Dict[str, Any], config_path: str) -> None:
     os.makedirs(os.path.dirname(config_path), exist_ok=True)
     
     with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+        f.write(json.dumps(config, indent=2, ensure_ascii=False))
 
 
 def get_env_var(name: str, default: Optional[str] = None) -> Optional[str]:
@@ -3,11 +3,35 @@ Test configuration and fixtures for the 4IR Backend Project Summit.
 """
 
 import pytest
-import os
 import sys
+from pathlib import Path
+from unittest.mock import patch, DEFAULT
 
-# Add src directory to Python path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Make the project root (for src.* imports) and src directory importable, once per session
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# The loop factory hook needs pytest-asyncio 1.4+; older versions ignore it and use the default loop
+if uvloop is not None:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def app_config():
+    """Fixture providing an AppConfig built once per test session from the default environment."""
+    from src.constants import AppConfig
+    
+    return AppConfig()
 
 
 @pytest.fixture
@@ -37,4 +61,13 @@ def temp_env_vars(monkeypatch):
     for key, value in test_vars.items():
         monkeypatch.setenv(key, value)
     
-    return test_vars
\ No newline at end of file
+    return test_vars
+
+
+@pytest.fixture
+def app_mocks():
+    """Fixture patching the Application lifecycle methods and the app logger."""
+    with patch.multiple(
+        'src.app.Application', _setup=DEFAULT, _main_loop=DEFAULT, _cleanup=DEFAULT
+    ) as mocks, patch('src.app.logger') as mock_logger:
+        yield {**mocks, 'logger': mock_logger}
\ No newline at end of file
@@ -4,13 +4,8 @@ Tests for the main application module.
 
 import pytest
 from unittest.mock import patch, MagicMock
-import sys
-import os
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from app import Application
+from src.app import Application
 
 
 class TestApplication:
@@ -47,43 +42,31 @@ class TestApplication:
         
         mock_logger.info.assert_called_with("Cleaning up application resources...")
     
-    @patch('src.app.Application._cleanup')
-    @patch('src.app.Application._main_loop')
-    @patch('src.app.Application._setup') 
-    @patch('src.app.logger')
-    def test_run_method_success(self, mock_logger, mock_setup, mock_main_loop, mock_cleanup):
+    def test_run_method_success(self, app_mocks):
         """Test successful run method execution."""
         app = Application()
         app.run()
         
-        mock_setup.assert_called_once()
-        mock_main_loop.assert_called_once()
-        mock_cleanup.assert_called_once()
-        mock_logger.info.assert_called_with("Starting application...")
+        app_mocks['_setup'].assert_called_once()
+        app_mocks['_main_loop'].assert_called_once()
+        app_mocks['_cleanup'].assert_called_once()
+        app_mocks['logger'].info.assert_called_with("Starting application...")
     
-    @patch('src.app.Application._cleanup')
-    @patch('src.app.Application._main_loop')
-    @patch('src.app.Application._setup')
-    @patch('src.app.logger')
-    def test_run_method_keyboard_interrupt(self, mock_logger, mock_setup, mock_main_loop, mock_cleanup):
+    def test_run_method_keyboard_interrupt(self, app_mocks):
         """Test run method with keyboard interrupt."""
-        mock_main_loop.side_effect = KeyboardInterrupt()
+        app_mocks['_main_loop'].side_effect = KeyboardInterrupt()
         
         app = Application()
         app.run()
         
-        mock_setup.assert_called_once()
-        mock_main_loop.assert_called_once()
-        mock_cleanup.assert_called_once()
-        mock_logger.info.assert_any_call("Application interrupted by user")
+        app_mocks['_setup'].assert_called_once()
+        app_mocks['_main_loop'].assert_called_once()
+        app_mocks['_cleanup'].assert_called_once()
+        app_mocks['logger'].info.assert_any_call("Application interrupted by user")
     
-    @patch('src.app.Application._cleanup')
-    @patch('src.app.Application._main_loop')
-    @patch('src.app.Application._setup')
-    @patch('src.app.logger')
-    def test_run_method_exception_debug_mode(self, mock_logger, mock_setup, mock_main_loop, mock_cleanup):
+    def test_run_method_exception_debug_mode(self, app_mocks):
         """Test run method with exception in debug mode."""
-        mock_main_loop.side_effect = ValueError("Test error")
+        app_mocks['_main_loop'].side_effect = ValueError("Test error")
         
         app = Application()
         app.config.debug = True
@@ -91,7 +74,7 @@ class TestApplication:
         with pytest.raises(ValueError):
             app.run()
         
-        mock_setup.assert_called_once()
-        mock_main_loop.assert_called_once()
-        mock_cleanup.assert_called_once()
-        mock_logger.error.assert_called_with("Application error: Test error")
\ No newline at end of file
+        app_mocks['_setup'].assert_called_once()
+        app_mocks['_main_loop'].assert_called_once()
+        app_mocks['_cleanup'].assert_called_once()
+        app_mocks['logger'].error.assert_called_with("Application error: Test error")
\ No newline at end of file
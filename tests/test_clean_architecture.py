@@ -4,19 +4,24 @@ Tests for clean architecture implementation.
 
 import pytest
 import asyncio
+import json
 from unittest.mock import patch, MagicMock
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from src.models.user import User
 from src.repositories.user_repository import UserRepository
 from src.services.user_service import UserService
 from src.controllers.user_controller import UserController
 from src.exceptions import ValidationException, NotFoundError
-from src.constants import AppConfig
+from src.dto import UserCreateDTO, UserUpdateDTO, UserResponseDTO, PaginationDTO
+from src.middlewares import (
+    MiddlewareChain, LoggingMiddleware, SecurityMiddleware, ExceptionHandlingMiddleware,
+    PerformanceMiddleware
+)
+
+
+def _build_users(count):
+    """Build distinct users for bulk and scale repository tests."""
+    return [User(email=f"user{i}@example.com", name=f"User {i}", age=20) for i in range(count)]
 
 
 class TestCleanArchitecture:
@@ -47,7 +52,6 @@ class TestCleanArchitecture:
             'is_active': True
         }
     
-    @pytest.mark.asyncio
     async def test_user_repository_crud(self, user_repository, sample_user_data):
         """Test repository CRUD operations."""
         # Create user
@@ -91,7 +95,37 @@ class TestCleanArchitecture:
         deleted_user = await user_repository.get_by_id(created_user.id)
         assert deleted_user is None
     
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("k", [1, 32, 256])
+    async def test_user_repository_bulk_crud(self, user_repository, k):
+        """Test repository bulk creation and lookups."""
+        users = _build_users(k)
+        created_users = await user_repository.create_many(users)
+        
+        assert len(created_users) == k
+        assert len(await user_repository.get_all(limit=k)) == k
+        
+        retrieved_users = await asyncio.gather(*[user_repository.get_by_id(user.id) for user in users])
+        assert [user.id for user in retrieved_users] == [user.id for user in users]
+        
+        last_user = await user_repository.get_by_email(f"user{k - 1}@example.com")
+        assert last_user is not None
+        assert last_user.id == users[-1].id
+        
+        deleted = await asyncio.gather(*[user_repository.delete(user.id) for user in users])
+        assert all(deleted)
+        assert await user_repository.get_all() == []
+    
+    @pytest.mark.scale
+    async def test_user_repository_concurrent_scale(self, user_repository):
+        """Test repository throughput with many concurrent creates and reads."""
+        users = await asyncio.gather(*[user_repository.create(user) for user in _build_users(1000)])
+        
+        retrieved_users = await asyncio.gather(*[user_repository.get_by_id(user.id) for user in users])
+        
+        assert len(retrieved_users) == 1000
+        assert all(user is not None for user in retrieved_users)
+        assert len({user.id for user in retrieved_users}) == 1000
+    
     async def test_user_service_validation(self, user_service, sample_user_data):
         """Test service layer validation."""
         # Test successful creation
@@ -103,29 +137,23 @@ class TestCleanArchitecture:
             await user_service.create(sample_user_data)
         
         # Test invalid email validation
-        invalid_data = sample_user_data.copy()
-        invalid_data['email'] = 'invalid-email'
+        invalid_data = {**sample_user_data, 'email': 'invalid-email'}
         
         with pytest.raises(ValueError, match="Invalid email format"):
             await user_service.create(invalid_data)
         
         # Test invalid age validation
-        invalid_data = sample_user_data.copy()
-        invalid_data['email'] = 'different@example.com'
-        invalid_data['age'] = -1
+        invalid_data = {**sample_user_data, 'email': 'different@example.com', 'age': -1}
         
         with pytest.raises(ValueError, match="Age must be between"):
             await user_service.create(invalid_data)
         
         # Test empty name validation
-        invalid_data = sample_user_data.copy()
-        invalid_data['email'] = 'another@example.com'
-        invalid_data['name'] = 'A'
+        invalid_data = {**sample_user_data, 'email': 'another@example.com', 'name': 'A'}
         
         with pytest.raises(ValueError, match="Name must be at least"):
             await user_service.create(invalid_data)
     
-    @pytest.mark.asyncio
     async def test_user_service_business_logic(self, user_service, sample_user_data):
         """Test service layer business logic."""
         # Create user
@@ -137,6 +165,11 @@ class TestCleanArchitecture:
         assert user_by_email is not None
         assert user_by_email.id == user_id
         
+        # Test get by malformed email, with and without format validation
+        assert await user_service.get_by_email('invalid-email') is None
+        assert await user_service.get_by_email('invalid-email', validate=True) is None
+        assert (await user_service.get_by_email(sample_user_data['email'], validate=True)).id == user_id
+        
         # Test activate/deactivate
         deactivated_user = await user_service.deactivate_user(user_id)
         assert deactivated_user.is_active is False
@@ -153,7 +186,6 @@ class TestCleanArchitecture:
         success = await user_service.delete(user_id)
         assert success is True
     
-    @pytest.mark.asyncio
     async def test_user_controller_responses(self, user_controller, sample_user_data):
         """Test controller response formatting."""
         # Test successful creation
@@ -163,6 +195,7 @@ class TestCleanArchitecture:
         assert response['status_code'] == 201
         assert 'data' in response
         assert response['data']['email'] == sample_user_data['email']
+        assert json.loads(json.dumps(response)) == response
         
         user_id = response['data']['id']
         
@@ -171,6 +204,7 @@ class TestCleanArchitecture:
         assert get_response['status'] == 'success'
         assert get_response['status_code'] == 200
         assert get_response['data']['id'] == user_id
+        assert json.loads(json.dumps(get_response)) == get_response
         
         # Test get all
         all_response = await user_controller.get_all()
@@ -188,8 +222,8 @@ class TestCleanArchitecture:
         not_found_response = await user_controller.get_by_id('nonexistent-id')
         assert not_found_response['status'] == 'error'
         assert not_found_response['status_code'] == 404
+        assert json.loads(json.dumps(not_found_response)) == not_found_response
     
-    @pytest.mark.asyncio
     async def test_user_controller_validation_errors(self, user_controller):
         """Test controller validation error handling."""
         # Test invalid data
@@ -200,9 +234,9 @@ class TestCleanArchitecture:
         assert response['status_code'] == 400
         assert 'Email is required' in response['error']['message']
     
-    def test_app_config(self):
+    def test_app_config(self, app_config):
         """Test application configuration."""
-        config = AppConfig()
+        config = app_config
         
         assert config.app_name == '4IR Backend Project Summit'
         assert config.app_version == '1.0.0'
@@ -215,7 +249,6 @@ class TestCleanArchitecture:
         assert isinstance(config.get_database_config(), dict)
         assert isinstance(config.to_dict(), dict)
     
-    @pytest.mark.asyncio
     async def test_integration_flow(self, user_controller, sample_user_data):
         """Test complete integration flow."""
         # 1. Create user
@@ -246,4 +279,98 @@ class TestCleanArchitecture:
         # 6. Delete user (should work now that it's inactive)
         delete_response = await user_controller.delete(user_id)
         assert delete_response['status'] == 'success'
-        assert delete_response['status_code'] == 204
\ No newline at end of file
+        assert delete_response['status_code'] == 204
+    
+    async def test_middleware_chain_exception_handlers(self):
+        """Test that only overriding middlewares handle exceptions."""
+        chain = MiddlewareChain()
+        chain.add_middleware(LoggingMiddleware())
+        chain.add_middleware(SecurityMiddleware())
+        chain.add_middleware(ExceptionHandlingMiddleware())
+        
+        assert len(chain.middlewares) == 3
+        assert [m.name for m in chain._exception_handlers] == ["ExceptionHandlingMiddleware"]
+        
+        response = await chain.process_exception(NotFoundError("User", "missing-id"))
+        assert response['status'] == 'error'
+        assert response['status_code'] == 404
+    
+    async def test_performance_middleware_duration(self):
+        """Test performance middleware reports request duration."""
+        middleware = PerformanceMiddleware()
+        
+        request = await middleware.process_request({'method': 'GET', 'path': '/users'})
+        assert isinstance(request['_perf_start'], int)
+        
+        response = await middleware.process_response({'status_code': 200, '_perf_start': request['_perf_start']})
+        assert response['_performance']['duration_ms'] >= 0
+    
+    async def test_user_service_email_cache_invalidation(self, user_service, sample_user_data):
+        """Test cached email lookups are invalidated on email change and delete."""
+        created_user = await user_service.create(sample_user_data)
+        assert await user_service.get_by_email(sample_user_data['email']) is created_user
+        
+        await user_service.update(created_user.id, {'email': 'changed@example.com'})
+        assert await user_service.get_by_email(sample_user_data['email']) is None
+        assert await user_service.get_by_email('changed@example.com') is created_user
+        
+        # The old email is free again
+        other_user = await user_service.create(sample_user_data)
+        assert other_user.id != created_user.id
+        
+        await user_service.deactivate_user(other_user.id)
+        assert await user_service.delete(other_user.id) is True
+        assert await user_service.get_by_email(sample_user_data['email']) is None
+    
+    async def test_user_service_email_cache_repository_delete(self, user_service, user_repository, sample_user_data):
+        """Test cached email lookups notice users deleted directly through the repository."""
+        created_user = await user_service.create(sample_user_data)
+        other_user = await user_service.create({**sample_user_data, 'email': 'other@example.com'})
+        assert await user_service.get_by_email(sample_user_data['email']) is created_user
+        
+        assert await user_repository.delete(created_user.id) is True
+        assert await user_service.get_by_email(sample_user_data['email']) is None
+        
+        updated_user = await user_service.update(other_user.id, {'email': sample_user_data['email']})
+        assert updated_user.email == sample_user_data['email']
+    
+    async def test_user_repository_create_if_email_unique(self, user_repository, sample_user_data):
+        """Test repository guards creation on email uniqueness."""
+        created_user = await user_repository.create_if_email_unique(User(**sample_user_data))
+        assert created_user is not None
+        
+        duplicate = await user_repository.create_if_email_unique(User(**sample_user_data))
+        assert duplicate is None
+        assert len(await user_repository.get_all()) == 1
+    
+    def test_user_service_validate_emails_bulk(self, user_service):
+        """Test bulk email validation matches single-email validation."""
+        emails = ['test@example.com', 'invalid-email', '', None, 'a@b.com\nc@d.com', 'other@example.org']
+        
+        assert user_service.validate_emails_bulk(emails) == [True, False, False, False, False, True]
+        assert user_service.validate_emails_bulk([]) == []
+        
+        # '$' also matches before a trailing newline; both paths must still reject it
+        emails = ['a@b.com\n', 'a@b.com']
+        assert user_service.validate_emails_bulk(emails) == [False, True]
+        assert [user_service._is_valid_email(email) for email in emails] == [False, True]
+    
+    def test_dto_to_dict_skips_none(self):
+        """Test DTO serialization drops None fields and keeps set fields."""
+        assert UserCreateDTO(email='test@example.com', name='Test User').to_dict() == {
+            'email': 'test@example.com', 'name': 'Test User', 'is_active': True
+        }
+        assert UserUpdateDTO(name='Updated Name', is_active=False).to_dict() == {
+            'name': 'Updated Name', 'is_active': False
+        }
+        assert UserUpdateDTO().to_dict() == {}
+        assert PaginationDTO(skip=0, limit=10).to_dict() == {'skip': 0, 'limit': 10}
+        
+        response_dto = UserResponseDTO(
+            id='1', email='test@example.com', name='Test User', age=None,
+            is_active=True, created_at='2024-01-01T00:00:00', updated_at='2024-01-01T00:00:00'
+        )
+        assert response_dto.to_dict() == {
+            'id': '1', 'email': 'test@example.com', 'name': 'Test User', 'is_active': True,
+            'created_at': '2024-01-01T00:00:00', 'updated_at': '2024-01-01T00:00:00'
+        }
@@ -4,71 +4,81 @@ Tests for utility functions.
 
 import json
 import os
-import tempfile
 import pytest
-import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from utils import load_config, save_config, get_env_var
+import utils
+from utils import load_config, load_config_async, save_config, get_env_var
 
 
 class TestConfigFunctions:
     """Test cases for configuration functions."""
     
-    def test_save_and_load_config(self, sample_config):
+    @pytest.fixture(params=["json", "orjson"])
+    def json_backend(self, request, monkeypatch):
+        """Run a test against both the stdlib json and orjson parsers."""
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(utils, "orjson", None)
+        return request.param
+    
+    def test_save_and_load_config(self, sample_config, tmp_path, json_backend):
         """Test saving and loading configuration."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            config_path = f.name
+        config_path = str(tmp_path / "config.json")
+        
+        # Save config
+        save_config(sample_config, config_path)
+        
+        # Verify file exists
+        assert os.path.exists(config_path)
         
-        try:
-            # Save config
-            save_config(sample_config, config_path)
-            
-            # Verify file exists
-            assert os.path.exists(config_path)
-            
-            # Load config
-            loaded_config = load_config(config_path)
-            
-            # Verify loaded config matches original
-            assert loaded_config == sample_config
-            
-        finally:
-            # Cleanup
-            if os.path.exists(config_path):
-                os.unlink(config_path)
+        # Load config
+        loaded_config = load_config(config_path)
+        
+        # Verify loaded config matches original
+        assert loaded_config == sample_config
+    
+    def test_save_and_load_config_non_standard_values(self, tmp_path, json_backend):
+        """Test that values written by save_config load with either parser."""
+        config_path = str(tmp_path / "config.json")
+        config = {"threshold": float("inf"), "big": 2 ** 70}
+        
+        save_config(config, config_path)
+        
+        assert load_config(config_path) == config
     
     def test_load_config_file_not_found(self):
         """Test loading configuration from non-existent file."""
         with pytest.raises(FileNotFoundError):
             load_config("non_existent_file.json")
     
-    def test_load_config_invalid_json(self):
+    def test_load_config_invalid_json(self, tmp_path, json_backend):
         """Test loading configuration from invalid JSON file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write("invalid json content")
-            config_path = f.name
+        config_path = tmp_path / "config.json"
+        config_path.write_text("invalid json content")
         
-        try:
-            with pytest.raises(json.JSONDecodeError):
-                load_config(config_path)
-        finally:
-            os.unlink(config_path)
+        with pytest.raises(json.JSONDecodeError):
+            load_config(str(config_path))
     
-    def test_save_config_creates_directory(self, sample_config):
+    def test_save_config_creates_directory(self, sample_config, tmp_path):
         """Test that save_config creates directories if they don't exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = os.path.join(temp_dir, "subdir", "config.json")
-            
-            save_config(sample_config, config_path)
-            
-            assert os.path.exists(config_path)
-            
-            # Verify content
-            loaded_config = load_config(config_path)
-            assert loaded_config == sample_config
+        config_path = str(tmp_path / "subdir" / "config.json")
+        
+        save_config(sample_config, config_path)
+        
+        assert os.path.exists(config_path)
+        
+        # Verify content
+        loaded_config = load_config(config_path)
+        assert loaded_config == sample_config
+    
+    async def test_load_config_async(self, sample_config, tmp_path):
+        """Test loading configuration asynchronously."""
+        config_path = str(tmp_path / "config.json")
+        save_config(sample_config, config_path)
+        
+        loaded_config = await load_config_async(config_path)
+        assert loaded_config == sample_config
 
 
 class TestEnvironmentVariables: